@@ -2,22 +2,154 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import os
-import tempfile
-from typing import Iterable, List
+import shutil
+import stat
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
 
 import boto3
+import botocore.config
 import numpy as np
 import pandas as pd
 import tabula
 from singer_sdk import typing as th  # JSON schema typing helpers
 from singer_sdk.streams import Stream
 
+# Cached S3 listings keyed by (bucket, prefix), shared across stream
+# instances so one tap run issues at most one listing per prefix. Entries
+# expire after TAP_NOMAD_LISTING_EXPIRY seconds when that variable is set.
+_s3_listing_cache: Dict[Tuple[str, str], Tuple[float, List[str]]] = {}
+
+# Brazilian-locale amounts: drop thousands separators and turn the
+# decimal comma into a dot in one C-level scan per string
+_AMOUNT_TRANSLATION = str.maketrans({".": "", ",": "."})
+
+
+class FilePathNotFoundError(Exception):
+    """Raised when a configured file path is missing or empty."""
+
+
+@dataclass(frozen=True)
+class FileRef:
+    """A configured input file, with any s3:// URL parsed exactly once."""
+
+    path: str
+    is_s3: bool = False
+    bucket: str | None = None
+    key: str | None = None
+
+
+@functools.lru_cache(maxsize=1)
+def _s3_client():
+    """Return a process-wide S3 client.
+
+    Client construction parses the service model and builds a new
+    connection pool, so share one instance across all calls.
+
+    Returns:
+        return: A shared boto3 S3 client.
+    """
+    return boto3.client("s3", config=botocore.config.Config(max_pool_connections=50))
+
+
+def _fetch_pdf_from_s3(file_ref: FileRef) -> bytes:
+    """Download one PDF from S3 into memory.
+
+    Fetch-only so downloads can run in I/O threads while another PDF is
+    being parsed; boto3 releases the GIL during network reads.
+
+    Args:
+        file_ref: An S3-backed file with its bucket and key pre-parsed.
+
+    Returns:
+        return (bytes): The raw PDF content.
+    """
+    assert file_ref.bucket is not None and file_ref.key is not None
+    response = _s3_client().get_object(Bucket=file_ref.bucket, Key=file_ref.key)
+
+    # Buffer the PDF in memory, avoiding the temp-file round trip
+    buffer = io.BytesIO()
+    shutil.copyfileobj(response["Body"], buffer, length=1 << 20)
+    return buffer.getvalue()
+
+
+def _read_pdf(source) -> List[pd.DataFrame]:
+    """Run tabula on a local path or in-memory PDF buffer.
+
+    Args:
+        source: A local file path or file-like object holding the PDF.
+
+    Returns:
+        return (List): The raw tables extracted from the PDF.
+    """
+    nomad_raw_list: List[pd.DataFrame] = tabula.read_pdf(
+        source,
+        pages="all",
+        multiple_tables=False,
+        pandas_options={"header": None, "dtype": str},
+        area=[160, 32, 520, 570],
+    )  # type: ignore
+    return nomad_raw_list
+
+
+def _parse_pdf(file_ref: FileRef, pdf_bytes: bytes | None = None) -> List[dict]:
+    """Read one statement PDF and return its records.
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        file_ref: The file to read, with its S3 location pre-parsed.
+        pdf_bytes: Pre-fetched PDF content, when the download already
+            happened in a prefetch thread.
+
+    Returns:
+        return (List): A list of record dictionaries.
+    """
+    if pdf_bytes is not None:
+        nomad_raw_list = _read_pdf(io.BytesIO(pdf_bytes))
+    elif file_ref.is_s3:
+        nomad_raw_list = _read_pdf(io.BytesIO(_fetch_pdf_from_s3(file_ref)))
+    else:
+        nomad_raw_list = _read_pdf(file_ref.path)
+
+    nomad_raw: pd.DataFrame = nomad_raw_list[0]
+    # Each record spans 3 raw rows; strided slices reshape the
+    # table in C instead of cell-by-cell iloc access.
+    arr = nomad_raw.to_numpy(copy=False)
+    typeamt = arr[1::3, 2]
+    nomad: pd.DataFrame = pd.DataFrame(
+        {
+            "description": arr[0::3, 0],
+            "date": arr[1::3, 1],
+            "type": [x[:1] for x in typeamt],
+            "amount": [x[4:] for x in typeamt],
+            "status": arr[2::3, 0],
+        },
+        copy=False,
+    )
+
+    # Statement dates are dd/mm/yyyy; the explicit format keeps pandas on
+    # its C parsing path instead of per-element dateutil fallback
+    nomad["date"] = pd.to_datetime(nomad["date"], format="%d/%m/%Y")
+    nomad["amount"] = [x.translate(_AMOUNT_TRANSLATION) for x in nomad["amount"]]
+    amt = nomad["amount"].astype(float).to_numpy()
+    sign = np.where(nomad["type"].to_numpy() == "-", -1.0, 1.0)
+    nomad["amount"] = amt * sign
+    cols = ("date", "amount", "description", "status")
+    nomad = nomad[list(cols)]
+
+    return [dict(zip(cols, row)) for row in nomad.itertuples(index=False, name=None)]
+
 
 class NomadStream(Stream):
     """Stream class for Nomad streams."""
 
-    file_paths: List[str] = []
+    file_paths: List[FileRef] = []
 
     def __init__(self, *args, **kwargs):
         """Init NomadStream.
@@ -31,26 +163,36 @@ class NomadStream(Stream):
         super().__init__(*args, **kwargs)
 
     def list_s3_files_in_folder(self, s3_bucket: str, s3_folder: str) -> List[str]:
-        s3_client = boto3.client("s3")
-        response = s3_client.list_objects_v2(Bucket=s3_bucket, Prefix=s3_folder)
+        cached = _s3_listing_cache.get((s3_bucket, s3_folder))
+        if cached is not None:
+            listed_at, file_paths = cached
+            expiry = os.environ.get("TAP_NOMAD_LISTING_EXPIRY")
+            if not expiry or time.time() - listed_at < float(expiry):
+                return file_paths
+
+        # Paginate so prefixes with more than 1000 keys are fully listed
+        paginator = _s3_client().get_paginator("list_objects_v2")
         file_paths = []
-        for item in response.get("Contents", []):
-            if not item["Key"].endswith("/"):
-                file_paths.append(f"s3://{s3_bucket}/{item['Key']}")
+        for page in paginator.paginate(Bucket=s3_bucket, Prefix=s3_folder):
+            for item in page.get("Contents", []):
+                if not item["Key"].endswith("/"):
+                    file_paths.append(f"s3://{s3_bucket}/{item['Key']}")
+        _s3_listing_cache[(s3_bucket, s3_folder)] = (time.time(), file_paths)
         return file_paths
 
-    def get_file_paths(self) -> list:
-        """Return a list of file paths to read.
+    def get_file_paths(self) -> List[FileRef]:
+        """Return a list of files to read.
 
         This tap accepts file names and directories so it will detect
         directories and iterate files inside, both in local files and
-        in AWS S3.
+        in AWS S3. Each entry carries its S3 bucket/key pre-parsed so
+        downstream code never re-splits the URL.
 
         Returns:
-            return (List): A list with file paths to read.
+            return (List): A list of FileRef entries to read.
 
         Raises:
-            Exception: When file path does not exist.
+            FilePathNotFoundError: When file path does not exist.
         """
         # Cache file paths so we dont have to iterate multiple times
         if self.file_paths:
@@ -58,35 +200,52 @@ class NomadStream(Stream):
 
         file_path = self.file_config["path"]
         if not file_path:
-            raise Exception("file_path is not provided.")
+            raise FilePathNotFoundError("file_path is not provided.")
 
         if file_path.startswith("s3://"):
             path_split = file_path.split("/")
             s3_bucket, s3_key = path_split[2], "/".join(path_split[3:])
             if s3_key.endswith("/"):
                 # If the S3 URL points to a folder, list all files inside
-                file_paths = self.list_s3_files_in_folder(s3_bucket, s3_key)
-                self.file_paths = file_paths
+                prefix = f"s3://{s3_bucket}/"
+                self.file_paths = [
+                    FileRef(p, is_s3=True, bucket=s3_bucket, key=p.removeprefix(prefix))
+                    for p in self.list_s3_files_in_folder(s3_bucket, s3_key)
+                ]
             else:
                 # Treat the S3 URL as a single file
-                self.file_paths = [file_path]
-                file_paths = [file_path]
-        elif os.path.isdir(file_path):
-            clean_file_path = os.path.normpath(file_path) + os.sep
-            file_paths = []
-            for filename in os.listdir(clean_file_path):
-                file_paths.append(clean_file_path + filename)
-            self.file_paths = file_paths
-        elif os.path.exists(file_path):
-            self.file_paths = [file_path]
-            file_paths = [file_path]
+                self.file_paths = [
+                    FileRef(file_path, is_s3=True, bucket=s3_bucket, key=s3_key)
+                ]
         else:
-            raise Exception(f"File path does not exist: {file_path}")
+            # One stat call tells us both that the path exists and
+            # whether it is a directory
+            try:
+                path_stat = os.stat(file_path)
+            except FileNotFoundError:
+                raise FilePathNotFoundError(
+                    f"File path does not exist: {file_path}"
+                ) from None
+
+            if stat.S_ISDIR(path_stat.st_mode):
+                clean_file_path = os.path.normpath(file_path) + os.sep
+                # scandir reuses the stat info from the directory walk, so
+                # filtering out subdirectories costs no extra syscalls
+                with os.scandir(clean_file_path) as entries:
+                    self.file_paths = [
+                        FileRef(e.path)
+                        for e in entries
+                        if e.is_file() and e.name.endswith(".pdf")
+                    ]
+            else:
+                self.file_paths = [FileRef(file_path)]
 
         if not self.file_paths:
-            raise Exception(f"No acceptable files found for stream '{self.name}'.")
+            raise FilePathNotFoundError(
+                f"No acceptable files found for stream '{self.name}'."
+            )
 
-        return file_paths
+        return self.file_paths
 
     name = "nomad_transactions"
     replication_key = "date"
@@ -98,44 +257,12 @@ class NomadStream(Stream):
         th.Property("status", th.StringType, required=True),
     ).to_dict()
 
-    def read_pdf_from_s3(self, s3_bucket: str, s3_key: str):
-        # Use boto3 to download the file from S3 and then read it
-        s3_client = boto3.client("s3")
-        response = s3_client.get_object(Bucket=s3_bucket, Key=s3_key)
-        pdf_content = response["Body"].read()
-
-        # Create a temporary file-like object for tabula to read from
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_file.write(pdf_content)
-            temp_file_path = temp_file.name
-
-        try:
-            nomad_raw_list: List[pd.DataFrame] = tabula.read_pdf(
-                temp_file_path,
-                pages="all",
-                multiple_tables=False,
-                pandas_options={"header": None},
-                area=[160, 32, 520, 570],
-            )  # type: ignore
-        finally:
-            # Clean up the temporary file
-            os.remove(temp_file_path)
-        return nomad_raw_list
-
-    def read_pdf_from_local(self, file_path: str):
-        nomad_raw_list: List[pd.DataFrame] = tabula.read_pdf(
-            file_path,
-            pages="all",
-            multiple_tables=False,
-            pandas_options={"header": None},
-            area=[160, 32, 520, 570],
-        )  # type: ignore
-        return nomad_raw_list
-
     def get_records(self, context: dict | None) -> Iterable[dict]:
         """Yield a generator of record-type dictionary objects.
 
         This function will yield a lot of records based on the defined streams.
+        PDFs are parsed in a process pool so JVM startup and table
+        extraction overlap across files.
 
         Args:
             context: An optional context as dictionary.
@@ -143,44 +270,33 @@ class NomadStream(Stream):
         Yields:
             yields: A yielding record with the stream records.
         """
-        for file_path in self.get_file_paths():
-            if file_path.endswith(".pdf"):
-                if file_path.startswith("s3://"):
-                    s3_bucket, s3_key = file_path.split("/", 3)[2:]
-                    nomad_raw_list = self.read_pdf_from_s3(s3_bucket, s3_key)
-                else:
-                    nomad_raw_list = self.read_pdf_from_local(file_path)
-
-                nomad_raw: pd.DataFrame = nomad_raw_list[0]
-                i = 0
-                df_list = []
-                while i < len(nomad_raw):
-                    df_list.append(
-                        [
-                            nomad_raw.iloc[i, 0],
-                            nomad_raw.iloc[i + 1, 1],
-                            nomad_raw.iloc[i + 1, 2][:1],
-                            nomad_raw.iloc[i + 1, 2][4:],
-                            nomad_raw.iloc[i + 2, 0],
-                        ]
-                    )
-                    i += 3
-
-                nomad: pd.DataFrame = pd.DataFrame(
-                    df_list, columns=["description", "date", "type", "amount", "status"]
-                )
-
-                nomad["date"] = pd.to_datetime(nomad["date"], dayfirst=True)
-                nomad["amount"] = [
-                    x.replace(".", "").replace(",", ".") for x in nomad["amount"]
-                ]
-                nomad["amount"] = np.where(
-                    nomad["type"] == "-",
-                    -1 * nomad["amount"].astype(float),
-                    nomad["amount"].astype(float),
-                )
-                nomad = nomad[["date", "amount", "description", "status"]]
-                nomad = nomad.convert_dtypes()
-
-                for r in nomad.to_dict("records"):
-                    yield r
+        pdf_refs = [r for r in self.get_file_paths() if r.path.endswith(".pdf")]
+
+        if len(pdf_refs) <= 1:
+            # Not worth spinning up worker processes for a single file
+            for file_ref in pdf_refs:
+                yield from _parse_pdf(file_ref)
+            return
+
+        max_workers = min(len(pdf_refs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_parse_pdf, r) for r in pdf_refs if not r.is_s3]
+            s3_refs = [r for r in pdf_refs if r.is_s3]
+            if s3_refs:
+                # Prefetch downloads in I/O threads and hand the bytes to
+                # a parse worker as each GetObject completes, so network
+                # time overlaps JVM/table-extraction time
+                with ThreadPoolExecutor(max_workers=2) as fetcher:
+                    fetches = {
+                        fetcher.submit(_fetch_pdf_from_s3, r): r for r in s3_refs
+                    }
+                    for fetched in as_completed(fetches):
+                        futures.append(
+                            executor.submit(
+                                _parse_pdf,
+                                fetches[fetched],
+                                pdf_bytes=fetched.result(),
+                            )
+                        )
+            for future in as_completed(futures):
+                yield from future.result()
@@ -17,6 +17,8 @@ class TapNomad(Tap):
 
     name = "tap-nomad"
 
+    _file_configs_cache: List[dict] | None = None
+
     config_jsonschema = th.PropertiesList(
         th.Property(
             "files",
@@ -43,6 +45,10 @@ class TapNomad(Tap):
         Returns:
             return (List): A list with file configs.
         """
+        # Cache the parsed configs so repeated calls dont re-read the file
+        if self._file_configs_cache is not None:
+            return self._file_configs_cache
+
         files = self.config.get("files")
         files_definition = self.config.get("files_definition")
         if files_definition:
@@ -55,6 +61,7 @@ class TapNomad(Tap):
         if not files:
             self.logger.error("No file definitions found.")
             exit(1)
+        self._file_configs_cache = files
         return files
 
     def discover_streams(self) -> list[NomadStream]: